@@ -1,22 +1,234 @@
+import warnings
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
-from statsmodels.formula.api import ols
-import matplotlib.pyplot as plt
+from scipy import linalg, stats
+
+from typing import Optional, Union, List
+
+# numba is optional. Without it the fit runs on SciPy's LAPACK routines.
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+def _fit_ols_py(X, y):
+    """
+    Fits y = intercept + X @ slopes in the least squares sense by QR
+    decomposition. X holds only the independent variables; the intercept is
+    handled by centering X and y on their means instead of adding a column of
+    ones, which leaves one column less to factor.
 
-from typing import Union, List
+    Returns (beta, t statistics of beta, residual variance, residual degrees
+    of freedom, fitted values, rank of the design matrix [1 | X]). beta and t
+    are intercept first, then one per column of X. If the design is rank
+    deficient, only the rank is meaningful; refit with _fit_ols_lapack.
+
+    """
+    n, k = X.shape
+    p = k + 1
+    df_resid = n - p
+
+    x_mean = X.sum(axis=0) / n
+    y_mean = y.sum() / n
+    Xc = X - x_mean
+    yc = y - y_mean
+
+    # Xc = QR, so Xc @ slopes = yc reduces to R @ slopes = Q.T @ yc
+    Q, R = np.linalg.qr(Xc)
+
+    # Rank is estimated from the diagonal of R rather than a separate SVD.
+    # |R[j, j]| is the norm of the part of column j not explained by the
+    # columns before it, so it is compared with that column's own norm; this
+    # keeps the test independent of the scale of each variable.
+    # The intercept adds one to the rank of the centered columns.
+    R_diag = np.abs(np.diag(R))
+    col_sq = np.zeros(k)
+    for i in range(n):
+        for j in range(k):
+            col_sq[j] += Xc[i, j] * Xc[i, j]
+    rcond = max(n, p) * np.finfo(np.float64).eps
+    rank = 1
+    for j in range(R_diag.shape[0]):
+        if R_diag[j] > np.sqrt(col_sq[j]) * rcond:
+            rank += 1
+    if rank < p:
+        return np.zeros(p), np.full(p, np.nan), np.nan, df_resid, np.zeros(n), rank
+
+    slopes = np.linalg.solve(R, np.ascontiguousarray(Q.T) @ yc)
+    intercept = y_mean - x_mean @ slopes
+
+    fitted = X @ slopes + intercept
+    residuals = y - fitted
+    # With no residual degrees of freedom the variance is undefined. An exact
+    # fit (sigma2 == 0) gives infinite t statistics, as in statsmodels.
+    sigma2 = (residuals @ residuals) / df_resid if df_resid > 0 else np.nan
+
+    # cov(slopes) = sigma^2 * (Xc.T @ Xc)^-1 = sigma^2 * R^-1 @ R^-1.T
+    # Only its diagonal (the squared row norms of R^-1) is needed, so each
+    # column v of R^-1 is found by back substitution and its squares are
+    # accumulated, without storing R^-1 or the covariance matrix
+    R_inv_row_sq = np.zeros(k)
+    v = np.empty(k)
+    for j in range(k):
+        v[j] = 1.0 / R[j, j]
+        for i in range(j - 1, -1, -1):
+            acc = 0.0
+            for m in range(i + 1, j + 1):
+                acc += R[i, m] * v[m]
+            v[i] = -acc / R[i, i]
+        for i in range(j + 1):
+            R_inv_row_sq[i] += v[i] * v[i]
+
+    # var(intercept) = sigma^2 * (1/n + x_mean @ (Xc.T @ Xc)^-1 @ x_mean)
+    # and x_mean @ (R.T @ R)^-1 @ x_mean = w @ w, where R.T @ w = x_mean is
+    # found by forward substitution
+    w = np.empty(k)
+    for i in range(k):
+        acc = x_mean[i]
+        for m in range(i):
+            acc -= R[m, i] * w[m]
+        w[i] = acc / R[i, i]
+
+    beta = np.empty(p)
+    beta[0] = intercept
+    beta[1:] = slopes
+    t = np.empty(p)
+    t[0] = intercept / np.sqrt(sigma2 * (1.0 / n + w @ w))
+    t[1:] = slopes / np.sqrt(sigma2 * R_inv_row_sq)
+
+    return beta, t, sigma2, df_resid, fitted, rank
+
+def _fit_ols_lapack(X, y):
+    """
+    Same as _fit_ols_py, but built on SciPy's LAPACK wrappers, for when the
+    numba kernel is not used. Uses column-pivoted QR (the factorization behind
+    lstsq's 'gelsy' driver), which tolerates ill-conditioned X. If the design
+    is rank deficient, the slopes are the minimum norm solution (with columns
+    scaled to unit norm) and the t statistics use the pseudo-inverse
+    covariance with n - rank degrees of freedom, as statsmodels does.
+
+    """
+    n, k = X.shape
+    p = k + 1
+    df_resid = n - p
+
+    x_mean = X.mean(axis=0)
+    y_mean = y.mean()
+    Xc = X - x_mean
+    yc = y - y_mean
+
+    # Xc[:, piv] = QR. EasyOLS checks that X and y are finite before fitting,
+    # so SciPy's checks are skipped. Works in X's precision (float32 or
+    # float64).
+    Q, R, piv = linalg.qr(Xc, mode='economic', pivoting=True, check_finite=False)
+    # Each |R[j, j]| is compared with the norm of its own column, as in
+    # _fit_ols_py, so small scale variables are not mistaken for dependent ones
+    R_diag = np.abs(np.diag(R))
+    rcond = max(n, p) * np.finfo(X.dtype).eps
+    rank = 1 + int(np.sum(R_diag > np.linalg.norm(Xc, axis=0)[piv][:len(R_diag)] * rcond))
+
+    if rank < p:
+        # Minimum norm solution and pseudo-inverse covariance from the SVD
+        # (the decomposition gelsd uses), keeping the rank - 1 largest
+        # singular values. Columns are scaled to unit norm first so the
+        # cutoff does not depend on their units.
+        norms = np.linalg.norm(Xc, axis=0)
+        norms[norms == 0] = 1
+        U, S, Vt = linalg.svd(Xc / norms, full_matrices=False, check_finite=False, lapack_driver='gesdd')
+        S_inv = np.zeros_like(S)
+        S_inv[:rank - 1] = 1 / S[:rank - 1]
+        # pinv(Xc.T @ Xc) = (B @ B.T) / outer(norms, norms)
+        B = Vt.T * S_inv
+
+        slopes = (B @ (U.T @ yc)) / norms
+        intercept = y_mean - x_mean @ slopes
+        fitted = X @ slopes + intercept
+        residuals = y - fitted
+        # Only rank parameters are estimable
+        df_resid = n - rank
+        sigma2 = (residuals @ residuals) / df_resid if df_resid > 0 else np.nan
+
+        w = B.T @ (x_mean / norms)
+        beta = np.concatenate([[intercept], slopes])
+        t = np.empty(p)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t[0] = intercept / np.sqrt(sigma2 * (1 / n + w @ w))
+            t[1:] = slopes / np.sqrt(sigma2 * np.einsum('ij,ij->i', B, B) / norms**2)
+        return beta, t, sigma2, df_resid, fitted, rank
+
+    slopes = np.empty(k)
+    slopes[piv] = linalg.solve_triangular(R, Q.T @ yc, check_finite=False)
+    intercept = y_mean - x_mean @ slopes
+
+    fitted = X @ slopes + intercept
+    residuals = y - fitted
+    sigma2 = (residuals @ residuals) / df_resid if df_resid > 0 else np.nan
+
+    # Diagonal of (Xc.T @ Xc)^-1 is the squared row norms of R^-1, permuted
+    R_inv = linalg.solve_triangular(R, np.eye(k), check_finite=False)
+    # var(intercept) = sigma^2 * (1/n + w @ w), where R.T @ w = x_mean[piv]
+    w = linalg.solve_triangular(R, x_mean[piv], trans='T', check_finite=False)
+
+    beta = np.concatenate([[intercept], slopes])
+    t = np.empty(p)
+    # An exact fit divides by zero; inf t statistics are the intended result
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t[0] = intercept / np.sqrt(sigma2 * (1 / n + w @ w))
+        t[1:][piv] = slopes[piv] / np.sqrt(sigma2 * np.einsum('ij,ij->i', R_inv, R_inv))
+
+    return beta, t, sigma2, df_resid, fitted, rank
+
+if HAVE_NUMBA:
+    # An explicit signature compiles eagerly at import (or loads the cached
+    # build), so the first fit does not pay the compilation cost.
+    # error_model='numpy' makes division by zero give inf/NaN like NumPy
+    # instead of raising, and fastmath leaves out the no-inf/no-NaN
+    # assumptions because those values are valid results here.
+    _fit_ols = njit(
+        "Tuple((float64[::1], float64[::1], float64, int64, float64[::1], int64))(float64[:, ::1], float64[::1])",
+        cache=True,
+        error_model='numpy',
+        fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'},
+    )(_fit_ols_py)
+else:
+    _fit_ols = _fit_ols_lapack
+
+# Rank of the design matrix by (id(df), independent_vars, number of rows,
+# dtype). It only chooses which solver runs: refitting a design already known
+# to be rank deficient goes straight to _fit_ols_lapack instead of trying the
+# numba kernel first. Both kernels still compute the rank on every fit, so a
+# stale entry (id reuse after garbage collection, or df edited in place)
+# cannot change the result. Least recently used entries are evicted past
+# _RANK_CACHE_SIZE.
+_RANK_CACHE = OrderedDict()
+_RANK_CACHE_SIZE = 128
 
 class EasyOLS:
     """
-    Easily generate readable conclusions and plot based on OLS summary data.
+    Easily generate readable conclusions and plot based on OLS fit data.
     Works with 1 dependent variable and 1+ independent variables.
     
     Parameters:
     - dependent_var (str) - Column name of pandas.DataFrame
     - independent_vars (str or list(str)) - Column name(s) of pandas.DataFrame
     - df - (pandas.DataFrame)
+    - jit (bool, optional) - Fit with the numba-compiled kernel. None (default)
+    uses it when numba is installed, False always uses SciPy's LAPACK routines,
+    which can be faster for very small data.
+    - dtype (numpy float type, optional) - Precision of the fit, np.float64
+    (default) or np.float32. float32 halves memory traffic for large data;
+    coefficients and confidences match float64 to float32 precision (about
+    1e-4 relative on data.csv), less closely for badly conditioned data. float32
+    always uses SciPy's LAPACK routines.
     
     Methods:
-    - print_summary() - Prints standard statsmodels ols summary and prints human-friendly 
-    conclusions below.
+    - summary() - Prints human-friendly conclusions.
+    - fit_many(X, Y, has_intercept=True) - Class method. Fits each column of Y
+    against X with one shared QR decomposition and returns the coefficients
+    as a k x p array.
     - plot() - Prints scatterplot of original data and predicted values
         - Parameters (optional):
             - title (str)
@@ -35,186 +247,242 @@ class EasyOLS:
     - dependent_var (str)
     - independent_vars (str or list(str))
     - df (pandas.DataFrame)
-    - formula
-    - model
-    - internal_dependent_var
-    - internal_independent_vars
+    - jit (bool or None)
+    - dtype (numpy.dtype)
+    - formula (str) - Equivalent statsmodels formula, built on access
+    - model - Always None. Kept for compatibility; the fit no longer uses a
+    statsmodels model.
 
     
 
     """
-    def __init__(self, dependent_var: str, independent_vars: Union[str, List[str]], df):
+    def __init__(self, dependent_var: str, independent_vars: Union[str, List[str]], df, jit: Optional[bool] = None, dtype=np.float64):
         if not isinstance(dependent_var, str):
             raise ValueError("dependent_var must be a string")
 
-        if not isinstance(independent_vars, str) and not all(isinstance(var, str) for var in independent_vars):
-            raise ValueError("independent_vars must be a string or an array of strings")
+        # Check the common single string case first; iterating a string
+        # would check each of its characters. Any other iterable of strings,
+        # such as a list, pandas.Index or numpy array, is accepted.
+        if isinstance(independent_vars, str):
+            independent_var_list = [independent_vars]
+        else:
+            try:
+                independent_var_list = list(independent_vars)
+            except TypeError:
+                raise ValueError("independent_vars must be a string or an array of strings")
+            if not independent_var_list or not all(isinstance(var, str) for var in independent_var_list):
+                raise ValueError("independent_vars must be a string or an array of strings")
 
         if not isinstance(df, pd.DataFrame):
             raise ValueError("df must be a DataFrame")
 
+        if jit and not HAVE_NUMBA:
+            raise ValueError("jit=True requires numba to be installed")
+
+        if np.dtype(dtype) not in (np.float32, np.float64):
+            raise ValueError("dtype must be np.float32 or np.float64")
+
         self.dependent_var = dependent_var
         self.independent_vars = independent_vars
         self.df = df
+        self.jit = jit
+        self.dtype = np.dtype(dtype)
 
-        self.formula = None
         self.model = None
 
-        # Variables in formula passed to statsmodels.formula.api.ols
-        # Contain Q('')
-        self.internal_dependent_var = None
-        self.internal_independent_vars = None
+        # Names of the design matrix columns: Intercept, then independent
+        # variables in the order they were given
+        self._colnames = ["Intercept"] + independent_var_list
+
+        # Rows with a missing value in any model column are dropped, as the
+        # statsmodels formula API did
+        data = df[[dependent_var] + self._colnames[1:]].dropna()
+
+        # Columns are pulled out of df once as dtype arrays and shared by
+        # the fit and plot(). The compiled fit kernel requires C-contiguous,
+        # writable arrays. No intercept column is built; the fit centers
+        # the data instead.
+        self._X = np.ascontiguousarray(data[self._colnames[1:]].to_numpy(dtype=self.dtype, copy=True))
+        self._y = np.ascontiguousarray(data[dependent_var].to_numpy(dtype=self.dtype, copy=True))
+
+        if not (np.isfinite(self._X).all() and np.isfinite(self._y).all()):
+            raise ValueError("df must not contain infinite values in dependent_var or independent_vars")
+
+        self._rank_key = (id(df), tuple(self._colnames[1:]), len(self._y), self.dtype)
+        # None until known; set by the fit if not cached
+        self._rank = _RANK_CACHE.get(self._rank_key)
+        if self._rank is not None:
+            _RANK_CACHE.move_to_end(self._rank_key)
 
         self.coefficients = None
         self.confidences = None
+        # Predicted values of dependent_var for each row of df without
+        # missing values
+        self._fitted = None
 
-        # The order of these functions matters
-        self.__create_formula()
-        self.__define_model()
-        self.__extract_var_names()
         self.__fit()
 
-    def __create_formula(self):
+    @property
+    def formula(self):
         """
-        Creates formula parameter for statsmodels.formula.api.ols
-        """
-        # https://www.statsmodels.org/stable/generated/statsmodels.formula.api.ols.html
-        # Final formula will look like this:
-        #   'Q("Foo Bar") ~ Q("Bizz Buzz")'
-        #      ^ must be ", CANNOT be '
-        # Or, if there are multiple independent variables, final formula will
-        # look like this:
-        #   'Q("Foo Bar") ~ Q("Bizz Buzz") + Q("Baz - Qux")'
-        #
-        # statsmodels.formula.api.ols("Foo Bar ~ Bizz Buzz", pandasDataFrame)
-        # will raise an error due to spaces in column names.
-        #
-        # The Q function allows spaces in column names, as long as single
-        # quotation marks (') are used.
-        # Q('Foo Bar') - WRONG
-        # Q{"Foo Bar"} - RIGHT
-
-        # Q("Foo Bar") ~ Q("Bizz Buzz")
-        # ^^^^^^^^^^^^
-        dependent_part = f"Q(\"{self.dependent_var}\")"
-
-        if isinstance(self.independent_vars, str):
-            # A single dependent variable was passed as argument
-            # Q("Foo Bar") + Q("Bizz Buzz")'
-            #                ^^^^^^^^^^^^^^
-            independent_part = f"Q(\"{self.independent_vars}\")"
-        else:
-            # A list of dependent variables was passed as argument
-            # 'Q("Foo Bar") ~ Q("Bizz Buzz") + Q("Baz - Qux")'
-            #                 ^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
-            independent_part = ' + '.join([f"Q(\"{var}\")" for var in self.independent_vars])
+        Equivalent statsmodels.formula.api.ols formula, e.g.
+        'Q("Foo Bar") ~ Q("Bizz Buzz") + Q("Baz - Qux")'. Only built when read;
+        the fit does not use it.
 
-        formula = f"{dependent_part} ~ {independent_part}"
-        self.formula = formula
-
-
-    def __define_model(self):
         """
-        Creates the OLS model with the given formula and dataframe.
-        Does not fit the model.
+        independent_part = ' + '.join([f"Q(\"{var}\")" for var in self._colnames[1:]])
+        return f"Q(\"{self.dependent_var}\") ~ {independent_part}"
 
+    def __fit(self):
         """
-        self.model = ols(self.formula, self.df)
+        Fits the OLS model by QR decomposition of the centered data.
 
-    def __extract_var_names(self):
         """
-        Extracts names of the dependent variable and independent variables from
-        the formula. These names must be extracted from the model before it is
-        fitted.
+        p = len(self._colnames)
 
-        """
-        self.internal_dependent_var = self.model.endog_names
-        self.internal_independent_vars = self.model.exog_names
+        # The numba kernel is float64 only and does not handle rank deficient
+        # designs, so skip it for float32 or when the rank is already known to
+        # be too low
+        if self.jit is False or self.dtype != np.float64 or (self._rank is not None and self._rank < p):
+            fit_ols = _fit_ols_lapack
+        else:
+            fit_ols = _fit_ols
 
-    def __fit(self):
-        """
-        Fits the OLS model. Model must be defined first.
+        beta, t, _, df_resid, self._fitted, rank = fit_ols(self._X, self._y)
+        if rank < p and fit_ols is not _fit_ols_lapack:
+            beta, t, _, df_resid, self._fitted, rank = _fit_ols_lapack(self._X, self._y)
 
-        """
-        self.model = self.model.fit()
-        self.coefficients = self.model.params
-        self.confidences = 1 - self.model.pvalues
+        if rank < p:
+            warnings.warn(
+                f"independent_vars are linearly dependent (rank {rank} < {p}); "
+                "coefficients are the minimum norm solution and not all are identifiable",
+                RuntimeWarning,
+            )
 
-    def __format_var(self, var):
-        """
-        'Q("Foo Bar")' -> 'Foo Bar'
+        self._rank = _RANK_CACHE[self._rank_key] = rank
+        if len(_RANK_CACHE) > _RANK_CACHE_SIZE:
+            _RANK_CACHE.popitem(last=False)
+        pvalues = 2 * stats.t.sf(np.abs(t), df_resid)
+
+        self.coefficients = pd.Series(beta, index=self._colnames)
+        self.confidences = pd.Series(1 - pvalues, index=self._colnames)
 
+    @classmethod
+    def fit_many(cls, X, Y, has_intercept=True):
         """
-        if var == "Intercept":
-            return var
+        Fits one OLS model per column of Y against the same X, sharing a
+        single QR decomposition of X between all of them.
 
-        return var[3:len(var)-2]
+        Parameters:
+        - X (array-like, n x m) - Independent variables
+        - Y (array-like, n or n x k) - Dependent variable(s), one per column
+        - has_intercept (bool) - Prepend a column of ones to X so each model
+        has an intercept
 
-    def summary(self):
-        # standard statsmodels.formula.api.ols summary
-        print(self.model.summary())
+        Returns betas (numpy.ndarray, k x p). Row j holds the coefficients for
+        column j of Y, intercept first if has_intercept.
 
-        # Append EasyOLS conclusions below
-        print("\nConclusions:")
+        """
+        X = np.asarray(X, dtype=np.float64)
+        Y = np.asarray(Y, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[:, np.newaxis]
+        if Y.ndim == 1:
+            Y = Y[:, np.newaxis]
+        if X.ndim != 2 or Y.ndim != 2 or X.shape[0] != Y.shape[0]:
+            raise ValueError("X and Y must be 2D with the same number of rows")
+
+        if has_intercept:
+            X = np.column_stack([np.ones(X.shape[0]), X])
+
+        if X.shape[0] < X.shape[1]:
+            raise ValueError("X must have at least as many rows as coefficients to fit")
+
+        # One factorization; Q.T @ Y and the triangular solve handle all
+        # k right-hand sides at once
+        Q, R = np.linalg.qr(X)
+
+        # Same scale independent rank test as the EasyOLS fit: each |R[j, j]|
+        # against the norm of its own column
+        rcond = max(X.shape) * np.finfo(np.float64).eps
+        if np.any(np.abs(np.diag(R)) <= np.linalg.norm(X, axis=0) * rcond):
+            raise ValueError("X columns are linearly dependent")
+
+        betas = linalg.solve_triangular(R, Q.T @ Y, check_finite=False)
+        return betas.T
 
-        dependent_var = self.__format_var(self.internal_dependent_var)
-        independent_vars = [self.__format_var(var) for var in self.internal_independent_vars]
+    def summary(self):
+        print("Conclusions:")
+
+        dependent_var = self.dependent_var
+        independent_vars = self._colnames
 
-        areMultipleIndependentVars = False
         # Not counting Intercept as independent variable
-        if (len(independent_vars)>2):
-            areMultipleIndependentVars = True
+        areMultipleIndependentVars = len(independent_vars) > 2
 
         if (areMultipleIndependentVars):
             print(f"Independent variables: {', '.join(independent_vars[1:])}")
 
-        for i in range(0, len(independent_vars)):
-            # format as %, round to 2 decimal places
-            confidence = '{:.2%}'.format(self.confidences.iloc[i])
-            # round to 2 decimal places
-            coefficient = "{:.2f}".format(self.coefficients.iloc[i])
-
-
-            # Definitions from Example 2 from https://www.statology.org/intercept-in-regression/
-            if i==0:
-                # Intercept: The mean value of the response variable when all
-                # predictor variables are zero
-                if(areMultipleIndependentVars):
-                    print(f"This model is {confidence} confident when all independent variables are 0, the average value of {dependent_var} is {coefficient}.")
-                else:
-                    print(f"This model is {confidence} confident when {independent_vars[i+1]} is 0, the average value of {dependent_var} is {coefficient}.") # i will only ever be 1 if there are not multiple independent variables
-
-            else:
-                # Regular independent variable: The average change in the
-                # response variable for a one unit increase in the jth
-                # predictor variable, assuming all other predictor variables are held constant
-                if(areMultipleIndependentVars):
-                    print(f"This model is {confidence} confident increasing {independent_vars[i]} by 1 will, on average, change {dependent_var} by {'+' if float(coefficient) > 0 else ''}{coefficient} when all other independent variables are held constant.")
-                else:
-                    print(f"This model is {confidence} confident increasing {independent_vars[i]} by 1 will, on average, change {dependent_var} by {'+' if float(coefficient) > 0 else ''}{coefficient}.")
-                    
+        # format as %, round to 2 decimal places. A confidence is NaN when it
+        # cannot be estimated (e.g. a constant column or no residual degrees
+        # of freedom).
+        confidences = [
+            f"This model is {c:.2%} confident" if not np.isnan(c) else "This model cannot estimate its confidence, but"
+            for c in self.confidences.to_numpy()
+        ]
+        coefficients = self.coefficients.to_numpy()
+
+        # Definitions from Example 2 from https://www.statology.org/intercept-in-regression/
+
+        # Intercept: The mean value of the response variable when all
+        # predictor variables are zero
+        if(areMultipleIndependentVars):
+            intercept_condition = "all independent variables are 0"
+        else:
+            intercept_condition = f"{independent_vars[1]} is 0"
+        print(f"{confidences[0]} when {intercept_condition}, the average value of {dependent_var} is {coefficients[0]:.2f}.")
+
+        # Regular independent variable: The average change in the
+        # response variable for a one unit increase in the jth
+        # predictor variable, assuming all other predictor variables are held constant
+        held_constant = " when all other independent variables are held constant" if areMultipleIndependentVars else ""
+        for i in range(1, len(independent_vars)):
+            b = coefficients[i]
+            # round to 2 decimal places, with an explicit + for increases
+            coefficient = f"{b:+.2f}" if b > 0 else f"{b:.2f}"
+            print(f"{confidences[i]} increasing {independent_vars[i]} by 1 will, on average, change {dependent_var} by {coefficient}{held_constant}.")
+
     def plot(self, 
              title = None,
              xlabel = None, 
              ylabel = None,
              description = None):
-        if not isinstance(self.independent_vars, str) and hasattr(self.independent_vars, '__iter__') and len(self.independent_vars) > 1:
+        # Use the materialized column names; independent_vars may have been a
+        # one-shot iterator
+        if len(self._colnames) > 2:
             raise ValueError("Cannot create plot for models with multiple independent variables.")
+
+        # Imported here so importing easy_ols does not pay for matplotlib
+        import matplotlib.pyplot as plt
         
-        df_pred = self.df
-        df_pred[f"Predicted {self.dependent_var}"] = self.model.predict(df_pred[self.independent_vars])
-        
-        full_title = title if title else f"{self.independent_vars} vs. {self.dependent_var}"
+        x = self._X[:, 0]
+        y = self._y
+        y_pred = self._fitted
+
+        independent_var = self._colnames[1]
+        full_title = title if title else f"{independent_var} vs. {self.dependent_var}"
         if description:
             full_title += f"\n{description}"
         
         plt.figure()
         plt.title(full_title)
-        plt.xlabel(xlabel if xlabel else f"{self.independent_vars}")
+        plt.xlabel(xlabel if xlabel else f"{independent_var}")
         plt.ylabel(ylabel if ylabel else f"{self.dependent_var}")
         
-        plt.scatter(df_pred[self.independent_vars], df_pred[self.dependent_var], s=1, color='blue', alpha=0.5)
-        plt.scatter(df_pred[self.independent_vars], df_pred[f"Predicted {self.dependent_var}"], s=1, color='red', alpha=0.5)
+        # plt.plot with markers only draws a single Line2D, which renders much
+        # faster than a scatter PathCollection for many points
+        plt.plot(x, y, '.', color='blue', alpha=0.5, markersize=1, linestyle='none')
+        plt.plot(x, y_pred, '.', color='red', alpha=0.5, markersize=1, linestyle='none')
 
         plt.axhline(y=0, color='black',linewidth=0.5)
         
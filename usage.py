@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import numpy as np
 import pandas as pd
 
 from easy_ols import EasyOLS
@@ -12,4 +13,12 @@ myOLS.summary()
 
 myOLS.plot()
 
+# Fitting in float32 halves memory traffic; results match float64 to float32
+# precision
+features = data.columns.drop("quality")
+ols64 = EasyOLS("quality", features, data)
+ols32 = EasyOLS("quality", features, data, dtype=np.float32)
+assert np.allclose(ols32.coefficients, ols64.coefficients, rtol=1e-4)
+assert np.allclose(ols32.confidences, ols64.confidences, atol=1e-4)
+
 